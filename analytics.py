@@ -1,6 +1,95 @@
-from habit import Habit
+from habit import Habit, Periodicity
 from datetime import datetime
 from habittracker import HabitTracker
+from utils import read_choice
+from weakref import WeakKeyDictionary
+
+# habits with fewer completions than this are cheaper to recompute than to cache
+_STREAK_CACHE_MIN = 32
+# _streak_summary results keyed by habit, stored with the completion count they were computed for
+_streak_cache: "WeakKeyDictionary[Habit, tuple[int, tuple[int, int, int, int]]]" = WeakKeyDictionary()
+
+def _streaks_from_ordinals(days: list[int], threshold: int) -> list[int]:
+    """
+    Split a sorted list of day ordinals into streak lengths.
+
+    Two consecutive days belong to the same streak when they are at most `threshold` days apart, 
+    including days that fall on the same date.
+
+    Args:
+        days (list[int]): The sorted day ordinals of the completions.
+        threshold (int): The largest gap in days that keeps a streak going.
+
+    Returns:
+        list[int]: The length of each streak, in chronological order.
+    """
+    streaks = []
+    streak = 1
+    for i in range(1, len(days)):
+        if days[i] - days[i-1] <= threshold:
+            streak += 1
+        else:
+            streaks.append(streak)
+            streak = 1
+    streaks.append(streak)
+    return streaks
+
+def _streak_list(habit: Habit) -> list[int]:
+    """
+    Return the length of every streak of a habit.
+
+    Args:
+        habit (Habit): The habit object containing the completion dates and periodicity.
+
+    Returns:
+        list[int]: The length of each streak in chronological order, or an empty list if the habit was never completed.
+    """
+    if len(habit._ordinals) == 0:
+        return []
+    return _streaks_from_ordinals(sorted(habit._ordinals), habit.periodicity)
+
+def _streak_summary(habit: Habit) -> tuple[int, int, int, int]:
+    """
+    Return the shortest, average, and longest streaks of a habit along with the number of streaks.
+
+    Unlike _streak_list, this walks the completion ordinals once and only keeps running totals, without 
+    building the list of all streaks. Results for habits with many completions are cached until the habit 
+    is checked off again.
+
+    Args:
+        habit (Habit): The habit object containing the completion dates and periodicity.
+
+    Returns:
+        tuple: The shortest, average, and longest streaks and the number of streaks, all 0 if the habit was 
+        never completed. The average streak is rounded to the nearest whole number.
+    """
+    completions = len(habit._ordinals)
+    if completions == 0:
+        return 0, 0, 0, 0
+    cached = _streak_cache.get(habit)
+    if cached is not None and cached[0] == completions:
+        return cached[1]
+    days = sorted(habit._ordinals)
+    threshold = habit.periodicity
+    lo = hi = total = count = 0
+    streak = 1
+    # one step past the end so the final streak is closed by the same branch
+    for i in range(1, len(days) + 1):
+        if i < len(days) and days[i] - days[i-1] <= threshold:
+            streak += 1
+            continue
+        if count == 0 or streak < lo:
+            lo = streak
+        if streak > hi:
+            hi = streak
+        total += streak
+        count += 1
+        streak = 1
+    summary = lo, round(total/count), hi, count
+    if completions >= _STREAK_CACHE_MIN:
+        # completions are only ever appended, so the count is enough to tell a stale entry
+        _streak_cache[habit] = (completions, summary)
+    return summary
 
 def get_habit_streaks(habit: Habit):
     """
@@ -8,6 +97,8 @@ def get_habit_streaks(habit: Habit):
 
     A streak is defined as a continuous period of time where the habit is completed daily or weekly,
     depending on the habit's periodicity. The start of a streak is the day the habit is registered.
+    Two completions continue a streak when they are at most 1 (daily) or 7 (weekly) days apart, so a 
+    second completion on the same day extends the streak instead of breaking it.
 
     Args:
         habit (Habit): The habit object containing the completion dates and periodicity.
@@ -15,33 +106,10 @@ def get_habit_streaks(habit: Habit):
     Returns:
         tuple: A tuple containing the shortest, average, and longest streaks, and a list of all streaks.
         The average streak is rounded to the nearest whole number.
-
-    Raises:
-        ValueError: If the habit's periodicity is not 'daily' or 'weekly'.
     """
-    completion_dates = sorted(habit.completion_dates)
-    if len(completion_dates) == 0:
+    streaks = _streak_list(habit)
+    if len(streaks) == 0:
         return 0, 0, 0, []
-    if len(completion_dates) == 1:
-        return 1, 1, 1, [1]
-    streaks = []
-    streak = 1
-    if habit.periodicity == 'daily':
-        for i in range(1, len(completion_dates)):
-            if (completion_dates[i].date() - completion_dates[i-1].date()).days == 1:
-                streak += 1
-            else:
-                streaks.append(streak)
-                streak = 1
-    elif habit.periodicity == 'weekly':
-        for i in range(1, len(completion_dates)):
-            if (completion_dates[i].date() - completion_dates[i-1].date()).days <= 7:
-                streak += 1
-            else:
-                streaks.append(streak)
-                streak = 1
-    else:
-        raise ValueError("Invalid periodicity")
     return min(streaks), round(sum(streaks)/len(streaks)), max(streaks), streaks
 
 def get_longest_habit_streak(habits: list[Habit]):
@@ -60,33 +128,30 @@ def get_longest_habit_streak(habits: list[Habit]):
     Raises:
         ValueError: If the habits list is empty.
     """
-    longest_streaks = {}
     if not habits or len(habits) == 0:
         raise ValueError("No habits provided")
-    for habit in habits:
-        longest_streaks[habit.name] = (get_habit_streaks(habit)[2])
-    return max(longest_streaks, key=longest_streaks.get)
+    return max(habits, key=lambda habit: _streak_summary(habit)[2]).name
 
-def get_habits_with_same_periodicity(habits: list[Habit], periodicity: str):
+def get_habits_with_same_periodicity(tracker: HabitTracker, periodicity: Periodicity):
     """
-    Filter and return habits from a list that have the same periodicity.
+    Return the habits of a tracker that have the same periodicity.
 
-    This function iterates over the provided list of habits and returns a new list containing only 
-    the habits that have the same periodicity as the provided periodicity.
+    The tracker keeps its habits grouped by periodicity, so this function looks the group up 
+    instead of scanning every habit.
 
     Args:
-        habits (list[Habit]): A list of Habit objects to filter.
-        periodicity (str): The periodicity to filter by. This should be 'daily' or 'weekly'.
+        tracker (HabitTracker): The HabitTracker object containing the habits to filter.
+        periodicity (Periodicity): The periodicity to filter by.
 
     Returns:
         list[Habit]: A list of Habit objects that have the same periodicity as the provided periodicity.
 
     Raises:
-        ValueError: If the habits list is empty or if the periodicity is not 'daily' or 'weekly'.
+        ValueError: If the habits list is empty.
     """
-    if not habits or len(habits) == 0:
+    if not tracker.data or len(tracker.data) == 0:
         raise ValueError("No habits provided")
-    return [habit for habit in habits if habit.periodicity == periodicity]
+    return tracker.habits_with_periodicity(periodicity)
 
 def habits_analytics(tracker: HabitTracker):
     """
@@ -111,27 +176,26 @@ def habits_analytics(tracker: HabitTracker):
     \t4. Go Back To Main Menu
     """
     while True:
-        choice = int(input(menu))
+        choice = read_choice(menu, {1, 2, 3, 4})
         if choice == 1:
             habit_name = input("\tEnter the name of the habit: ")
-            if tracker.find_habit_from_name(habit_name) is None:
-                print("Habit not found")
+            habit, _ = tracker.find_habit_from_name(habit_name)
+            if habit is None:
                 continue
-            habit = tracker.find_habit_from_name(habit_name)[0]
-            shortest, average, longest, streaks = get_habit_streaks(habit)
+            shortest, average, longest, _ = _streak_summary(habit)
             print(f"\tShortest Streak: {shortest}")
             print(f"\tAverage Streak: {average}")
             print(f"\tLongest Streak: {longest}")
-        if choice == 2:
+        elif choice == 2:
             print(f"The habit with the longest streak is: '{get_longest_habit_streak(tracker.data)}'")
-        if choice == 3:
-            periodicity = input("\tEnter the periodicity (daily, weekly) : ")
-            if periodicity not in ['daily', 'weekly']:
-                print("\tInvalid periodicity")
+        elif choice == 3:
+            try:
+                periodicity = Periodicity.parse(input("\tEnter the periodicity (daily, weekly) : "))
+            except ValueError as e:
+                print(f"\t{e}")
                 continue
-            habits = get_habits_with_same_periodicity(tracker.data, periodicity)
+            habits = get_habits_with_same_periodicity(tracker, periodicity)
             for index, habit in enumerate(habits):
                 print(f"{index + 1}. {habit.name}")
-
-        if choice == 4:
+        elif choice == 4:
             break
\ No newline at end of file
@@ -1,9 +1,44 @@
-from enum import Enum
+from enum import IntEnum
 from datetime import datetime
 
-class Periodicity(str, Enum):
-    DAILY = "daily"
-    WEEKLY = "weekly"
+class Periodicity(IntEnum):
+    """
+    The periodicity of a habit.
+
+    Each member's value is the largest gap in days between two completions that keeps a streak going, 
+    so the periodicity doubles as the streak threshold. Members print as their lowercase name.
+    """
+    DAILY = 1
+    WEEKLY = 7
+
+    def __str__(self) -> str:
+        """
+        Return the lowercase name of the periodicity, e.g. 'daily'.
+
+        Returns:
+            str: The lowercase name of the periodicity.
+        """
+        return self.name.lower()
+
+    @classmethod
+    def parse(cls, value: str | int) -> "Periodicity":
+        """
+        Create a Periodicity from its name ('daily', 'weekly') or its value in days.
+
+        Args:
+            value (str | int): The name or value of the periodicity.
+
+        Returns:
+            Periodicity: The matching periodicity.
+
+        Raises:
+            ValueError: If the value does not match any periodicity.
+        """
+        if isinstance(value, str):
+            if value.upper() not in cls.__members__:
+                raise ValueError("Invalid periodicity")
+            return cls[value.upper()]
+        return cls(value)
 
 MONTHS = ("January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December")
 
@@ -13,14 +48,18 @@ class Habit:
 
     Attributes:
         name (str): The name of the habit.
-        periodicity (Periodicity.value): The periodicity of the habit, either 'daily' or 'weekly'.
+        periodicity (Periodicity): The periodicity of the habit, either daily or weekly.
         creation_date (datetime): The date and time when the habit was created.
         completion_dates (list[datetime]): A list of dates and times when the habit was completed.
+        _ordinals (list[int]): The day ordinals of completion_dates, kept in sync for streak analysis.
 
     Methods:
         from_dict(data: dict): Create a Habit object from a dictionary.
         to_dict(): Convert the Habit object to a dictionary.
     """
+    # __weakref__ keeps habits usable as keys of the streak cache in analytics
+    __slots__ = ("name", "periodicity", "creation_date", "completion_dates", "_ordinals", "__weakref__")
+
     def __init__(self, name: str, periodicity: Periodicity) -> None:
         """
         Initialize a Habit object with a name, periodicity, creation date, and an empty list of completion dates.
@@ -30,9 +69,10 @@ class Habit:
             periodicity (Periodicity): The periodicity of the habit, either 'daily' or 'weekly'.
         """
         self.name: str = name
-        self.periodicity: Periodicity.value = periodicity.value
+        self.periodicity: Periodicity = periodicity
         self.creation_date: datetime = datetime.now()
         self.completion_dates : list[datetime] = []
+        self._ordinals: list[int] = []
         
     @classmethod
     def from_dict(cls, data: dict) -> "Habit":
@@ -45,9 +85,10 @@ class Habit:
         Returns:
             Habit: A Habit object with the data from the dictionary.
         """
-        habit = cls(data["name"], Periodicity(data["periodicity"]))
+        habit = cls(data["name"], Periodicity.parse(data["periodicity"]))
         habit.creation_date = datetime.fromisoformat(data["creation_date"])
-        habit.completion_dates = [datetime.fromisoformat(date) for date in data["completion_dates"]]
+        habit.completion_dates = list(map(datetime.fromisoformat, data["completion_dates"]))
+        habit._ordinals = list(map(datetime.toordinal, habit.completion_dates))
         return habit
     
     def to_dict(self) -> dict:
@@ -59,29 +100,44 @@ class Habit:
         """
         return {
             "name": self.name,
-            "periodicity": self.periodicity,
+            "periodicity": str(self.periodicity),
             "creation_date": self.creation_date.isoformat(),
             "completion_dates": [date.isoformat() for date in self.completion_dates]
         }
     
-    def check_off(self) -> None:
+    def check_off(self, now: datetime | None = None) -> None:
         """
         Mark the habit as completed for the current period.
 
         This method checks the last completion date of the habit and the current date. If the habit has not been 
         completed in the current period (day, week, month, or year, depending on the habit's periodicity), 
         it adds the current date and time to the list of completion dates.
+
+        Args:
+            now (datetime, optional): The current date and time. Defaults to datetime.now().
         """
+        if now is None:
+            now = datetime.now()
         if len(self.completion_dates) == 0:
-            self.completion_dates.append(datetime.now())
+            self._add_completion(now)
         else:
             last_date = self.completion_dates[-1]
             if self.periodicity == Periodicity.DAILY:
-                if last_date.date() != datetime.now().date():
-                    self.completion_dates.append(datetime.now())
+                if last_date.date() != now.date():
+                    self._add_completion(now)
             elif self.periodicity == Periodicity.WEEKLY:
-                if (datetime.now() - last_date).days >= 7:
-                    self.completion_dates.append(datetime.now())
+                if (now - last_date).days >= 7:
+                    self._add_completion(now)
+
+    def _add_completion(self, date: datetime) -> None:
+        """
+        Record a completion date along with its day ordinal.
+
+        Args:
+            date (datetime): The date and time the habit was completed.
+        """
+        self.completion_dates.append(date)
+        self._ordinals.append(date.toordinal())
 
     @classmethod
     def create_habit_from_cli(cls):
@@ -99,9 +155,7 @@ class Habit:
         """
         name = input("\tEnter the name of the habit: ")
         periodicity = input("\tEnter the periodicity of the habit (daily, weekly): ")
-        if periodicity.upper() not in Periodicity.__members__:
-            raise ValueError("Invalid periodicity")
-        return cls(name, Periodicity(periodicity))
+        return cls(name, Periodicity.parse(periodicity))
 
     
     def date(self, date: datetime) -> str:
@@ -124,7 +178,7 @@ class Habit:
         return f"{day} {MONTHS[month-1]} {year} at {hour}:{minutes} {am_pm}"
     
     
-    def can_check_off(self):
+    def can_check_off(self, now: datetime | None = None):
         """
         Determine if the habit can be checked off for the current period.
 
@@ -132,6 +186,9 @@ class Habit:
         completed in the current period (day or week, depending on the habit's periodicity), it returns True. 
         Otherwise, it returns False.
 
+        Args:
+            now (datetime, optional): The current date and time. Defaults to datetime.now().
+
         Returns:
             bool: True if the habit can be checked off for the current period, False otherwise.
 
@@ -140,15 +197,17 @@ class Habit:
         """
         if len(self.completion_dates) == 0:
             return True
+        if now is None:
+            now = datetime.now()
         last_date = self.completion_dates[-1]
         if self.periodicity == Periodicity.DAILY:
-            return last_date.date() != datetime.now().date()
+            return last_date.date() != now.date()
         elif self.periodicity == Periodicity.WEEKLY:
-            return (datetime.now() - last_date).days >= 7
+            return (now - last_date).days >= 7
         elif self.periodicity == Periodicity.MONTHLY:
-            return last_date.month != datetime.now().month
+            return last_date.month != now.month
         elif self.periodicity == Periodicity.YEARLY:
-            return last_date.year != datetime.now().year
+            return last_date.year != now.year
 
     def __str__(self) -> str:
         """
@@ -14,6 +14,9 @@ class HabitTracker:
 
     Attributes:
         data (list[Habit]): A list of Habit objects.
+        _by_name (dict[str, int]): Maps each habit name to its index in data.
+        _by_period (dict[Periodicity, list[Habit]]): Groups the habits in data by periodicity.
+        _dirty (bool): Whether data has changed since it was last loaded or saved.
 
     Methods:
         create_habit(): Create a new habit and add it to the data list.
@@ -22,19 +25,27 @@ class HabitTracker:
         """
         Initialize a HabitTracker object.
 
-        This method checks if a JSON file named "data.json" exists in the current directory. If it does, 
-        it loads the list of habits from the file. If it doesn't, it creates a new file and initializes 
-        an empty list of habits.
+        This method loads the list of habits from a JSON file named "data.json" in the current directory. 
+        If the file doesn't exist or is empty, it initializes an empty list of habits; a missing file is 
+        created on the next save.
         """
-        if "data.json" not in os.listdir():
-            with open("data.json", "w") as file:
-                json.dump([], file)
-                self.data: list[Habit] = []
-        else:
+        self._dirty = False
+        try:
             with open("data.json", "r") as file:
-                self.data = json.load(file)
-                if type(self.data) == list:
-                    self.data = [Habit.from_dict(habit) for habit in self.data]
+                raw = file.read()
+        except FileNotFoundError:
+            raw = ""
+            self._dirty = True
+        self.data: list[Habit] = json.loads(raw) if raw else []
+        if type(self.data) == list:
+            self.data = [Habit.from_dict(habit) for habit in self.data]
+        self._by_name: dict[str, int] = {}
+        for i, habit in enumerate(self.data):
+            # keep the first index so duplicate names in data.json resolve like the old linear scan
+            self._by_name.setdefault(habit.name, i)
+        self._by_period: dict[Periodicity, list[Habit]] = {periodicity: [] for periodicity in Periodicity}
+        for habit in self.data:
+            self._by_period[habit.periodicity].append(habit)
 
     def create_habit(self):
         """
@@ -48,23 +59,64 @@ class HabitTracker:
             ValueError: If a habit with the same name already exists.
         """
         habit = Habit.create_habit_from_cli()
-        if habit.name in [habit.name for habit in self.data]:
+        if habit.name in self._by_name:
             print(f"Habit with name {habit.name} already exists")
             return
         print(f"\tYour habit '{habit.name}' has been created successfully")
         print("\tYou can now check off this habit")
-        self.data.append(habit)
+        self._append(habit)
 
     def save_habit(self, habit: Habit):
         """
         Save a habit to the data list.
 
-        This method takes a Habit object and adds it to the data list.
+        This method takes a Habit object and adds it to the data list. If a habit with the same name 
+        already exists, it prints a message and leaves the data list unchanged.
 
         Args:
             habit (Habit): The Habit object to add to the data list.
         """
+        if habit.name in self._by_name:
+            print(f"Habit with name {habit.name} already exists")
+            return
+        self._append(habit)
+
+    def _append(self, habit: Habit):
+        """
+        Append a habit to the data list and record it in the name and periodicity indexes.
+
+        Args:
+            habit (Habit): The Habit object to append.
+        """
+        self._by_name[habit.name] = len(self.data)
+        self._by_period[habit.periodicity].append(habit)
         self.data.append(habit)
+        self._dirty = True
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """
+        Whether the data list has changed since it was last loaded or saved.
+
+        Returns:
+            bool: True if the data list needs to be saved, False otherwise.
+        """
+        return self._dirty
+
+    def habits_with_periodicity(self, periodicity: Periodicity) -> list[Habit]:
+        """
+        Return the habits in the data list that have the given periodicity.
+
+        The habits are kept grouped by periodicity, so this returns a copy of the matching group 
+        instead of scanning the data list.
+
+        Args:
+            periodicity (Periodicity): The periodicity to filter by.
+
+        Returns:
+            list[Habit]: The habits with the given periodicity, in the order they were added.
+        """
+        return list(self._by_period[periodicity])
 
     def view_all_habits(self):
         """
@@ -86,19 +138,22 @@ class HabitTracker:
         Raises:
             ValueError: If a habit with the entered name does not exist in the data list.
         """
+        now = datetime.now()
         print("\tHabits that can be checked off:")
         for i, habit in enumerate(self.data):
-            if habit.can_check_off():
+            if habit.can_check_off(now):
                 last_checked_off = len(habit.completion_dates) > 0 and habit.date(habit.completion_dates[-1]) or 'Never'
                 print(f"\t{i+1}. {habit.name} (Periodicity: {habit.periodicity}) (Last checked off: {last_checked_off})")
         habit_name = input("\tEnter the name of the habit you want to check off: ")
+        # the prompt may sit open for a while, so record the check-off at the time it was entered
+        now = datetime.now()
         try:
-            habit, index = self.find_habit_from_name(habit_name)
+            habit, _ = self.find_habit_from_name(habit_name)
             if habit is None:
                 return
-            if habit.can_check_off():
-                habit.check_off()
-                self.data[index] = habit
+            if habit.can_check_off(now):
+                habit.check_off(now)
+                self._dirty = True
                 print(f"\tChecked off habit: {habit}")
             else:
                 print("\tYou can't check off this habit yet")
@@ -110,11 +165,15 @@ class HabitTracker:
         Save the data list to a JSON file.
 
         This method converts each habit in the data list to a dictionary and saves the list of dictionaries 
-        to a JSON file named "data.json".
-        """
-        data = [habit.to_dict() for habit in self.data]
-        with open("data.json", "w") as file:
-            json.dump(data, file)
+        to a JSON file named "data.json". The file is written to a temporary path first and then moved into 
+        place, so a crash mid-write never leaves a truncated "data.json" behind.
+        """
+        # json.dumps encodes in one shot with the C encoder, json.dump writes chunk by chunk
+        data = json.dumps([habit.to_dict() for habit in self.data], separators=(",", ":"))
+        with open("data.json.tmp", "w") as file:
+            file.write(data)
+        os.replace("data.json.tmp", "data.json")
+        self._dirty = False
         
 
     def find_habit_from_name(self, name: str) -> Tuple[Habit, int] | Union[None, None]:
@@ -129,13 +188,12 @@ class HabitTracker:
 
         Returns:
             Habit: The first habit in the data list with the given name, or None if no such habit exists.
-            int: The index of the habit in the data list, or None if no such habit exists.
+            int: The index of the habit in the data list, or None if no such habit exists. Callers that only 
+            read or mutate the habit can ignore it; it is what a removal from the data list would need.
         """
-        i = 0
-        for habit in self.data:
-            if habit.name == name:
-                return habit, i
-            i += 1
+        index = self._by_name.get(name)
+        if index is not None:
+            return self.data[index], index
         print(f"No habit with name {name}")
         return None, None
         
@@ -159,6 +217,8 @@ class HabitTracker:
         It then adds these habits to the data list.
         """
         self.data = []
+        self._by_name = {}
+        self._by_period = {periodicity: [] for periodicity in Periodicity}
         daily_habits = ["Excercise", "Code", "Gaming"]
         weekly_habits = ["Read A book", "Meditate"]
         start_date = datetime(2024, 1, 1)
@@ -175,7 +235,7 @@ class HabitTracker:
                 "creation_date": start_date.isoformat(),
                 "completion_dates": [date.isoformat() for date in completion_dates]
             }
-            self.data.append(Habit.from_dict(data))
+            self._append(Habit.from_dict(data))
 
         for habit in weekly_habits:
             completion_dates = generate_random_dates_per_week(week_start_date, week_end_date)
@@ -185,5 +245,5 @@ class HabitTracker:
                 "creation_date": week_start_date.isoformat(),
                 "completion_dates": [date.isoformat() for date in completion_dates]
             }
-            self.data.append(Habit.from_dict(data))
+            self._append(Habit.from_dict(data))
         self.save_data()
\ No newline at end of file
@@ -1,6 +1,7 @@
 from habit import Habit
 from habittracker import HabitTracker
 from analytics import habits_analytics
+from utils import read_choice
 
 def main():
     """
@@ -25,7 +26,7 @@ def main():
     if habit_tracker.data == []:
         habit_tracker.generate_sample_data()
     while True:
-        choice = int(input(menu))
+        choice = read_choice(menu, {1, 2, 3, 4, 5})
         
         if choice == 1:
             habit_tracker.create_habit()
@@ -36,7 +37,8 @@ def main():
         elif choice == 4:
             habits_analytics(habit_tracker)
         elif choice == 5:
-            habit_tracker.save_data()
+            if habit_tracker.has_unsaved_changes:
+                habit_tracker.save_data()
             break
 
 if __name__ == "__main__":
@@ -1,7 +1,19 @@
-from faker import Faker
+import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-fake = Faker()
+@lru_cache(maxsize=1)
+def _faker():
+    """
+    Return a shared Faker instance, creating it on first use.
+
+    Importing and initializing Faker is slow, so it is deferred until sample data is actually generated.
+
+    Returns:
+        Faker: The shared Faker instance.
+    """
+    from faker import Faker
+    return Faker()
 
 def generate_random_dates(start_date: datetime, end_date: datetime, n: int) -> list[datetime]:
     """
@@ -16,16 +28,13 @@ def generate_random_dates(start_date: datetime, end_date: datetime, n: int) -> l
 
     Returns:
         list[datetime]: A list of n unique random dates between start_date and end_date.
-    """
-    fake_dates = []
-    while True:
-        fake_date = fake.date_between(start_date=start_date, end_date=end_date)
-        fake_dates.count(fake_date) == 0 and fake_dates.append(fake_date)
-        if len(fake_dates) == n:
-            break
 
-    fake_dates.sort()
-    return fake_dates
+    Raises:
+        ValueError: If n is larger than the number of days between start_date and end_date.
+    """
+    offsets = random.sample(range((end_date - start_date).days + 1), n)
+    offsets.sort()
+    return [start_date + timedelta(days=offset) for offset in offsets]
     
     
 def generate_random_dates_per_week(start_date: datetime, end_date: datetime) -> list[datetime]:
@@ -45,7 +54,7 @@ def generate_random_dates_per_week(start_date: datetime, end_date: datetime) ->
     weeks = set()
 
     while start_date <= end_date:
-        date = fake.date_between(start_date=start_date, end_date=end_date)
+        date = _faker().date_between(start_date=start_date, end_date=end_date)
         week_number = date.isocalendar()[1]
 
         if week_number not in weeks:
@@ -55,4 +64,24 @@ def generate_random_dates_per_week(start_date: datetime, end_date: datetime) ->
         start_date += timedelta(days=7)
 
     dates.sort()
-    return dates
\ No newline at end of file
+    return dates
+
+def read_choice(prompt: str, valid: set[int]) -> int:
+    """
+    Prompt the user for a menu choice until a valid one is entered.
+
+    This method keeps asking with the given prompt until the user enters one of the valid numbers, 
+    printing a message after every invalid entry instead of raising.
+
+    Args:
+        prompt (str): The menu or prompt to show.
+        valid (set[int]): The numbers that are accepted as a choice.
+
+    Returns:
+        int: The choice entered by the user.
+    """
+    while True:
+        choice = input(prompt).strip()
+        if choice.isdecimal() and int(choice) in valid:
+            return int(choice)
+        print("\tInvalid choice")